@@ -47,73 +47,77 @@ input_method = st.sidebar.radio(
 # Function to check safe state using Banker's Algorithm
 def check_safe_state(processes, resources, allocation_matrix, max_matrix, available_resources):
     num_processes = len(processes)
-    num_resources = len(resources)
     
     # Initialize work (available resources) and finish vector
-    work = available_resources.copy()
-    finish = [False] * num_processes
+    work = np.array(available_resources, copy=True)
+    finish = np.zeros(num_processes, dtype=bool)
     safe_sequence = []
     
     # Compute need matrix (Max - Allocation)
     need_matrix = max_matrix - allocation_matrix
     
-    # Safety algorithm
+    # Safety algorithm: each pass runs every unfinished process whose need fits in work
     while len(safe_sequence) < num_processes:
-        found = False
-        for i in range(num_processes):
-            if not finish[i]:
-                # Check if resources can be allocated
-                can_allocate = True
-                for j in range(num_resources):
-                    if need_matrix[i][j] > work[j]:
-                        can_allocate = False
-                        break
-                if can_allocate:
-                    # Simulate resource allocation
-                    for j in range(num_resources):
-                        work[j] += allocation_matrix[i][j]
-                    finish[i] = True
-                    safe_sequence.append(processes[i])
-                    found = True
-        if not found:
+        runnable = ~finish & np.all(need_matrix <= work, axis=1)
+        if not runnable.any():
             # No safe sequence exists
             return None, need_matrix
+        # Simulate resource allocation for the whole pass
+        work = work + np.sum(allocation_matrix[runnable], axis=0)
+        finish |= runnable
+        safe_sequence.extend(processes[i] for i in np.flatnonzero(runnable))
     return safe_sequence, need_matrix
 
+# Limits that keep the strategy list manageable for large systems
+MAX_PREEMPTION_STRATEGIES = 200
+MAX_LISTED_WAITING_PROCESSES = 10
+
 # Function to suggest resolution strategies
 def suggest_resolution_strategies(processes, resources, allocation_matrix, max_matrix, need_matrix):
     strategies = []
     
+    # Precompute per-process totals once instead of summing rows inside the loops
+    allocation_totals = np.sum(allocation_matrix, axis=1)
+    max_totals = np.sum(max_matrix, axis=1)
+    need_totals = np.sum(need_matrix, axis=1)
+    
     # Strategy 1: Process Termination
     for i, p in enumerate(processes):
-        allocated_resources = [resources[j] for j in range(len(resources)) if allocation_matrix[i][j] > 0]
-        needed_resources = [resources[j] for j in range(len(resources)) if need_matrix[i][j] > 0]
-        
-        impact_score = sum(allocation_matrix[i]) / sum(max_matrix[i]) if sum(max_matrix[i]) > 0 else 0
+        impact_score = allocation_totals[i] / max_totals[i] if max_totals[i] > 0 else 0
         
         strategies.append({
             "strategy_type": "Process Termination",
             "description": f"Terminate process {p}",
             "impact": f"Impact score: {impact_score:.2f}",
-            "details": f"Process {p} holds {sum(allocation_matrix[i])} units of resources and needs {sum(need_matrix[i])} more.",
+            "details": f"Process {p} holds {allocation_totals[i]} units of resources and needs {need_totals[i]} more.",
             "score": impact_score
         })
     
     # Strategy 2: Resource Preemption
-    for i, p in enumerate(processes):
-        for j, r in enumerate(resources):
-            if allocation_matrix[i][j] > 0:
-                impact_score = allocation_matrix[i][j] / sum(allocation_matrix[i]) if sum(allocation_matrix[i]) > 0 else 0
-                
-                waiting_processes = [proc for k, proc in enumerate(processes) if need_matrix[k][j] > 0]
-                
-                strategies.append({
-                    "strategy_type": "Resource Preemption",
-                    "description": f"Preempt {int(allocation_matrix[i][j])} units of resource {r} from process {p}",
-                    "impact": f"Impact score: {impact_score:.2f}",
-                    "details": f"This would allow waiting processes ({', '.join(waiting_processes)}) to proceed.",
-                    "score": impact_score
-                })
+    # Waiting processes depend only on the resource, so list them once per column
+    waiting_processes = []
+    for j in range(len(resources)):
+        waiting = [processes[k] for k in np.flatnonzero(need_matrix[:, j] > 0)]
+        if len(waiting) > MAX_LISTED_WAITING_PROCESSES:
+            waiting = waiting[:MAX_LISTED_WAITING_PROCESSES] + [f"{len(waiting) - MAX_LISTED_WAITING_PROCESSES} more"]
+        waiting_processes.append(", ".join(waiting))
+    
+    # Score every allocated cell at once and keep only the best candidates
+    rows, cols = np.nonzero(allocation_matrix > 0)
+    preemption_scores = allocation_matrix[rows, cols] / allocation_totals[rows]
+    best = np.argsort(preemption_scores, kind="stable")[:MAX_PREEMPTION_STRATEGIES]
+    
+    for idx in best:
+        i, j = rows[idx], cols[idx]
+        impact_score = preemption_scores[idx]
+        
+        strategies.append({
+            "strategy_type": "Resource Preemption",
+            "description": f"Preempt {int(allocation_matrix[i][j])} units of resource {resources[j]} from process {processes[i]}",
+            "impact": f"Impact score: {impact_score:.2f}",
+            "details": f"This would allow waiting processes ({waiting_processes[j]}) to proceed.",
+            "score": impact_score
+        })
     
     # Strategy 3: Resource Allocation Policy
     strategies.append({
@@ -232,75 +236,213 @@ def generate_system_metrics():
         "Network I/O (MB/s)": network_io
     }
 
-# Main application logic
-if input_method == "Demo Data":
-    st.sidebar.info("Using demo data with a safe state scenario (multi-instance resources)")
-    processes, resources, allocation_matrix, max_matrix, total_resources, available_resources = generate_demo_data()
+# Upper limits for the Manual Input grid editors
+MAX_MANUAL_PROCESSES = 500
+MAX_MANUAL_RESOURCES = 100
 
-elif input_method == "Manual Input":
-    st.sidebar.subheader("Define Processes and Resources")
-    
-    num_processes = st.sidebar.slider("Number of Processes", 2, 10, 4, key="num_processes")
-    num_resources = st.sidebar.slider("Number of Resources", 2, 10, 3, key="num_resources")
-    
-    processes = [f"P{i+1}" for i in range(num_processes)]
-    resources = [f"R{i+1}" for i in range(num_resources)]
-    
-    st.sidebar.subheader("Resource Configuration")
-    st.sidebar.markdown("Specify the total and available instances of each resource")
-    
-    total_resources = np.zeros(num_resources)
-    available_resources = np.zeros(num_resources)
-    
-    for j, r in enumerate(resources):
-        total_resources[j] = st.sidebar.number_input(
-            f"Total units of {r}", min_value=1, value=3, step=1, key=f"total_{j}"
-        )
-        available_resources[j] = st.sidebar.number_input(
-            f"Available units of {r}", min_value=0, value=1, step=1, key=f"avail_{j}"
+# Function to resize a matrix, keeping existing values and filling new cells
+def resize_matrix(df, index, columns, fill_value):
+    if df is None:
+        df = pd.DataFrame(index=index, columns=columns, dtype=float)
+    resized = df.reindex(index=index, columns=columns)
+    return resized.fillna(fill_value).astype(int)
+
+# Function to render a bulk grid editor whose base data only changes on resize
+# (fill_value may be a scalar or a per-column dict, as accepted by fillna;
+# min_values overrides the default minimum of 0 for individual columns)
+def matrix_editor(name, index, columns, fill_value, min_values=None):
+    shape = (len(index), len(columns))
+    if st.session_state.get(f"{name}_shape") != shape:
+        st.session_state[f"{name}_base"] = resize_matrix(
+            st.session_state.get(name), index, columns, fill_value
         )
+        st.session_state[f"{name}_shape"] = shape
     
-    # Initialize matrices
-    allocation_matrix = np.zeros((num_processes, num_resources))
-    max_matrix = np.zeros((num_processes, num_resources))
+    min_values = min_values or {}
+    column_config = {
+        c: st.column_config.NumberColumn(c, min_value=min_values.get(c, 0), step=1, format="%d") for c in columns
+    }
+    edited_df = st.data_editor(
+        st.session_state[f"{name}_base"],
+        column_config=column_config,
+        use_container_width=True,
+        key=f"{name}_editor_{shape[0]}x{shape[1]}"
+    )
+    # Cleared cells fall back to the column's fill value, which respects its minimum
+    st.session_state[name] = edited_df.fillna(fill_value).astype(int)
+    return st.session_state[name]
+
+# Function to edit the Manual Input matrices; edits only rerun this fragment
+@st.fragment
+def manual_input_editor(processes, resources):
+    st.markdown("Edit cells directly or paste a block of values copied from a spreadsheet.")
     
-    # Create tabs for allocation and max matrices
-    tab1, tab2 = st.tabs(["Resource Allocation", "Maximum Resources"])
+    tab1, tab2, tab3 = st.tabs(["Resource Allocation", "Maximum Resources", "Resource Configuration"])
     
     with tab1:
         st.subheader("Resource Allocation Matrix")
         st.markdown("Specify the number of resource units allocated to each process:")
-        for i, p in enumerate(processes):
-            cols = st.columns(num_resources)
-            for j, r in enumerate(resources):
-                with cols[j]:
-                    allocation_matrix[i][j] = st.number_input(
-                        f"{p} has {r}", min_value=0, value=0, step=1, key=f"alloc_{i}_{j}"
-                    )
+        alloc_df = matrix_editor("manual_allocation", processes, resources, 0)
     
     with tab2:
         st.subheader("Maximum Resource Matrix")
         st.markdown("Specify the maximum number of resource units each process may need:")
-        for i, p in enumerate(processes):
-            cols = st.columns(num_resources)
-            for j, r in enumerate(resources):
-                with cols[j]:
-                    max_matrix[i][j] = st.number_input(
-                        f"{p} max {r}", 
-                        min_value=int(allocation_matrix[i][j]), 
-                        value=max(1, int(allocation_matrix[i][j])), 
-                        step=1, 
-                        key=f"max_{i}_{j}"
-                    )
+        max_df = matrix_editor("manual_max", processes, resources, 1)
+    
+    with tab3:
+        st.subheader("Resource Configuration")
+        st.markdown("Specify the total and available instances of each resource:")
+        config_df = matrix_editor(
+            "manual_resources", resources, ["Total", "Available"], {"Total": 3, "Available": 1}, min_values={"Total": 1}
+        )
+    
+    allocation_matrix = alloc_df.to_numpy()
+    max_matrix = max_df.to_numpy()
+    total_resources = config_df["Total"].to_numpy()
+    available_resources = config_df["Available"].to_numpy()
     
     # Validate inputs
+    below_allocation = int(np.sum(max_matrix < allocation_matrix))
+    if below_allocation:
+        st.warning(
+            f"Warning: {below_allocation} maximum value(s) are below the allocation "
+            f"and will be treated as equal to it"
+        )
+        max_matrix = np.maximum(max_matrix, allocation_matrix)
+    
     allocated = np.sum(allocation_matrix, axis=0)
     for j, r in enumerate(resources):
         if allocated[j] + available_resources[j] > total_resources[j]:
-            st.sidebar.warning(
+            st.warning(
                 f"Warning: Allocated ({allocated[j]}) + Available ({available_resources[j]}) "
                 f"exceeds Total ({total_resources[j]}) for {r}"
             )
+    
+    # Re-analyze the edited state without rerunning the rest of the app
+    safe_sequence, _ = check_safe_state(processes, resources, allocation_matrix, max_matrix, available_resources)
+    if safe_sequence:
+        st.caption("Current input: ✅ safe state")
+    else:
+        st.caption("Current input: ⚠️ unsafe state")
+    
+    st.session_state['manual_matrices'] = (allocation_matrix, max_matrix, total_resources, available_resources)
+    
+    if st.button("Apply Changes", key="apply_manual_btn"):
+        st.rerun()
+
+# Rows shown per page when rendering large matrices
+MATRIX_PAGE_SIZE = 50
+
+# Number of steps listed in full before the safe sequence is summarized
+SAFE_SEQUENCE_PREVIEW = 10
+
+# Strategies shown per page in the Resolution Strategies list
+STRATEGY_PAGE_SIZE = 10
+
+# Function to pick the visible window of a long list, returning its start and end
+def page_selector(num_items, page_size, key):
+    num_pages = max(1, -(-num_items // page_size))
+    page = 1
+    if num_pages > 1:
+        # Keep a remembered page in range if the list has since shrunk
+        if st.session_state.get(f"{key}_page", 1) > num_pages:
+            st.session_state[f"{key}_page"] = num_pages
+        # No value= here: the page is owned by session state, which starts at min_value
+        page = st.number_input(
+            f"Page (1-{num_pages})", min_value=1, max_value=num_pages, step=1, key=f"{key}_page"
+        )
+    start = (int(page) - 1) * page_size
+    end = min(start + page_size, num_items)
+    return start, end
+
+# Function to render a matrix, paginating and styling only the visible rows
+def display_matrix(df, key=None, color=None):
+    num_rows = len(df)
+    
+    if key is None:
+        # No page selector: large matrices fall back to the plain, virtualized grid
+        if color is not None and num_rows <= MATRIX_PAGE_SIZE:
+            st.dataframe(df.style.highlight_max(axis=None, color=color))
+        else:
+            st.dataframe(df)
+        return
+    
+    start, end = page_selector(num_rows, MATRIX_PAGE_SIZE, key)
+    page_df = df.iloc[start:end]
+    
+    if color is not None and df.size > 0:
+        # Highlight the overall maximum, but only build styles for the visible window
+        max_value = df.to_numpy().max()
+        highlight = f"background-color: {color}"
+        st.dataframe(page_df.style.apply(
+            lambda data: np.where(data.to_numpy() == max_value, highlight, ""), axis=None
+        ))
+    else:
+        st.dataframe(page_df)
+    
+    if num_rows > MATRIX_PAGE_SIZE:
+        st.caption(f"Showing rows {start + 1}-{end} of {num_rows}")
+
+# Function to check whether two snapshots of the analysis inputs are identical
+def same_inputs(first, second):
+    first_processes, first_resources, *first_arrays = first
+    second_processes, second_resources, *second_arrays = second
+    if first_processes != second_processes or first_resources != second_resources:
+        return False
+    return all(np.array_equal(a, b) for a, b in zip(first_arrays, second_arrays))
+
+# Function to format a step number as an ordinal (1st, 2nd, 3rd, ...)
+def ordinal(n):
+    if 10 <= n % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+# Function to display a safe sequence of any length
+def display_safe_sequence(safe_sequence, key=None):
+    num_steps = len(safe_sequence)
+    
+    if num_steps <= SAFE_SEQUENCE_PREVIEW:
+        execution_order = [f"{ordinal(i + 1)}: {process}" for i, process in enumerate(safe_sequence)]
+        st.markdown("**Process Execution Order**:\n- " + "\n- ".join(execution_order))
+        st.markdown(f"**Sequence**: {' -> '.join(safe_sequence)}")
+        return
+    
+    # Summarize long sequences and keep the full order in a paginated table
+    head = " -> ".join(safe_sequence[:3])
+    tail = " -> ".join(safe_sequence[-3:])
+    st.markdown(f"**Sequence** ({num_steps} processes): {head} -> ... -> {tail}")
+    with st.expander("Full execution order"):
+        order_df = pd.DataFrame(
+            {"Process": safe_sequence},
+            index=[ordinal(i + 1) for i in range(num_steps)]
+        )
+        display_matrix(order_df, key=key)
+
+# Main application logic
+if input_method == "Demo Data":
+    st.sidebar.info("Using demo data with a safe state scenario (multi-instance resources)")
+    processes, resources, allocation_matrix, max_matrix, total_resources, available_resources = generate_demo_data()
+
+elif input_method == "Manual Input":
+    st.sidebar.subheader("Define Processes and Resources")
+    
+    num_processes = st.sidebar.number_input(
+        "Number of Processes", min_value=2, max_value=MAX_MANUAL_PROCESSES, value=4, step=1, key="num_processes"
+    )
+    num_resources = st.sidebar.number_input(
+        "Number of Resources", min_value=2, max_value=MAX_MANUAL_RESOURCES, value=3, step=1, key="num_resources"
+    )
+    
+    processes = [f"P{i+1}" for i in range(int(num_processes))]
+    resources = [f"R{i+1}" for i in range(int(num_resources))]
+    
+    # Edits happen inside a fragment; the analysis tabs pick them up on the next full rerun
+    manual_input_editor(processes, resources)
+    allocation_matrix, max_matrix, total_resources, available_resources = st.session_state['manual_matrices']
+    allocation_matrix = allocation_matrix.copy()
+    max_matrix = max_matrix.copy()
 
 elif input_method == "CSV Upload":
     st.sidebar.subheader("Upload CSV Files")
@@ -365,6 +507,16 @@ elif input_method == "CSV Upload":
         st.info("Please upload both CSV files to continue")
         processes, resources, allocation_matrix, max_matrix, total_resources, available_resources = generate_demo_data()
 
+# Discard analysis results unless they were computed from exactly the current inputs
+analysis_inputs = (
+    list(processes), list(resources),
+    np.array(allocation_matrix, copy=True), np.array(max_matrix, copy=True), np.array(available_resources, copy=True)
+)
+stored_inputs = st.session_state.get('analysis_inputs')
+if stored_inputs is None or not same_inputs(stored_inputs, analysis_inputs):
+    for key in ['analysis_inputs', 'analysis_results', 'strategies']:
+        st.session_state.pop(key, None)
+
 # Create tabs for the main content
 tab1, tab2, tab3, tab4 = st.tabs(["Analysis", "Visualization", "Resolution Strategies", "System Monitor"])
 
@@ -378,17 +530,17 @@ with tab1:
     with col1:
         st.subheader("Allocation Matrix")
         alloc_df = pd.DataFrame(allocation_matrix, index=processes, columns=resources)
-        st.dataframe(alloc_df.style.highlight_max(axis=None, color='lightgreen'))
+        display_matrix(alloc_df, key="alloc_view", color='lightgreen')
     
     with col2:
         st.subheader("Maximum Matrix")
         max_df = pd.DataFrame(max_matrix, index=processes, columns=resources)
-        st.dataframe(max_df.style.highlight_max(axis=None, color='lightsalmon'))
+        display_matrix(max_df, key="max_view", color='lightsalmon')
     
     with col3:
         st.subheader("Available Resources")
         avail_df = pd.DataFrame(available_resources, index=resources, columns=["Available"])
-        st.dataframe(avail_df)
+        display_matrix(avail_df, key="avail_view")
     
     # Analysis button
     if st.button("Run Deadlock Analysis", key="analyze_btn"):
@@ -399,36 +551,36 @@ with tab1:
             # Check safe state
             safe_sequence, need_matrix = check_safe_state(processes, resources, allocation_matrix, max_matrix, available_resources)
             
-            # Store in session state
-            st.session_state['safe_sequence'] = safe_sequence
-            st.session_state['need_matrix'] = need_matrix
+            # Store in session state, along with the inputs that were analyzed
+            st.session_state['analysis_results'] = (safe_sequence, need_matrix)
+            st.session_state['analysis_inputs'] = analysis_inputs
             
-            # Display results
+            # Generate resolution strategies
             if safe_sequence:
-                st.success("✅ System is in a SAFE STATE.")
-                st.subheader("Safe State Execution Order")
-                ordinals = ["First", "Second", "Third", "Fourth", "Fifth", "Sixth", "Seventh", "Eighth", "Ninth", "Tenth"]
-                execution_order = [f"{ordinals[i]}: {process}" for i, process in enumerate(safe_sequence)]
-                st.markdown("**Process Execution Order**:\n- " + "\n- ".join(execution_order))
-                st.markdown(f"**Sequence**: {' -> '.join(safe_sequence)}")
-                st.markdown("""
-                This execution order indicates the sequence in which processes can safely complete without causing a deadlock.
-                Each process acquires its needed resources, completes, and releases its resources, allowing the next process to proceed.
-                """)
-                
-                # Display need matrix
-                st.subheader("Need Matrix (Max - Allocation)")
-                need_df = pd.DataFrame(need_matrix, index=processes, columns=resources)
-                st.dataframe(need_df.style.highlight_max(axis=None, color='lightblue'))
+                st.session_state.pop('strategies', None)
             else:
-                st.error("⚠️ System is in an UNSAFE STATE. Potential deadlock detected.")
-                st.subheader("Need Matrix (Max - Allocation)")
-                need_df = pd.DataFrame(need_matrix, index=processes, columns=resources)
-                st.dataframe(need_df.style.highlight_max(axis=None, color='lightblue'))
-                
-                # Generate resolution strategies
                 strategies = suggest_resolution_strategies(processes, resources, allocation_matrix, max_matrix, need_matrix)
                 st.session_state['strategies'] = strategies
+    
+    # Display results (kept across reruns so large matrices can be paged through)
+    if 'analysis_results' in st.session_state:
+        safe_sequence, need_matrix = st.session_state['analysis_results']
+        
+        if safe_sequence:
+            st.success("✅ System is in a SAFE STATE.")
+            st.subheader("Safe State Execution Order")
+            display_safe_sequence(safe_sequence, key="safe_sequence_view")
+            st.markdown("""
+            This execution order indicates the sequence in which processes can safely complete without causing a deadlock.
+            Each process acquires its needed resources, completes, and releases its resources, allowing the next process to proceed.
+            """)
+        else:
+            st.error("⚠️ System is in an UNSAFE STATE. Potential deadlock detected.")
+        
+        # Display need matrix
+        st.subheader("Need Matrix (Max - Allocation)")
+        need_df = pd.DataFrame(need_matrix, index=processes, columns=resources)
+        display_matrix(need_df, key="need_view", color='lightblue')
 
 # Tab 2: Visualization
 with tab2:
@@ -437,15 +589,12 @@ with tab2:
     if st.button("Generate Visualization", key="viz_btn"):
         with st.spinner("Generating resource allocation graph..."):
             # Get safe sequence and need matrix
-            if 'safe_sequence' not in st.session_state:
-                safe_sequence, need_matrix = check_safe_state(
+            if 'analysis_results' not in st.session_state:
+                st.session_state['analysis_results'] = check_safe_state(
                     processes, resources, allocation_matrix, max_matrix, available_resources
                 )
-                st.session_state['safe_sequence'] = safe_sequence
-                st.session_state['need_matrix'] = need_matrix
-            else:
-                safe_sequence = st.session_state['safe_sequence']
-                need_matrix = st.session_state['need_matrix']
+                st.session_state['analysis_inputs'] = analysis_inputs
+            safe_sequence, need_matrix = st.session_state['analysis_results']
             
             # Visualize the graph
             fig = visualize_graph(processes, resources, allocation_matrix, need_matrix, safe_sequence)
@@ -482,7 +631,12 @@ with tab3:
         if strategies:
             st.subheader("Recommended Strategies")
             
-            for i, strategy in enumerate(strategies):
+            # Only build expanders for the visible page of the (score-sorted) list
+            start, end = page_selector(len(strategies), STRATEGY_PAGE_SIZE, "strategies_view")
+            if len(strategies) > STRATEGY_PAGE_SIZE:
+                st.caption(f"Showing strategies {start + 1}-{end} of {len(strategies)}")
+            
+            for i, strategy in enumerate(strategies[start:end], start=start):
                 with st.expander(f"{i+1}. {strategy['strategy_type']}: {strategy['description']}"):
                     st.markdown(f"**Impact**: {strategy['impact']}")
                     st.markdown(f"**Details**: {strategy['details']}")
@@ -527,6 +681,7 @@ with tab3:
                                 process_idx = processes.index(process_name)
                                 
                                 # Validate preemption
+                                analyzed_need_matrix = st.session_state['analysis_results'][1]
                                 if allocation_matrix[process_idx][resource_idx] < units:
                                     st.error(
                                         f"Cannot preempt {units} units of {resource_name} from {process_name}: "
@@ -539,7 +694,7 @@ with tab3:
                                 
                                 # Find a waiting process to allocate the resource to
                                 for p_idx, p in enumerate(processes):
-                                    if st.session_state['need_matrix'][p_idx][resource_idx] >= units:
+                                    if analyzed_need_matrix[p_idx][resource_idx] >= units:
                                         allocation_matrix[p_idx][resource_idx] += units
                                         st.info(
                                             f"{units} units of resource {resource_name} preempted from {process_name} "
@@ -564,16 +719,14 @@ with tab3:
                             processes, resources, allocation_matrix, max_matrix, available_resources
                         )
                         
-                        st.session_state['safe_sequence'] = safe_sequence
-                        st.session_state['need_matrix'] = need_matrix
+                        # Results stay keyed to the inputs on screen, so the Analysis tab shows the outcome
+                        st.session_state['analysis_results'] = (safe_sequence, need_matrix)
+                        st.session_state['analysis_inputs'] = analysis_inputs
                         
                         if safe_sequence:
                             st.success("✅ System is now in a SAFE STATE.")
                             st.subheader("Safe State Execution Order")
-                            ordinals = ["First", "Second", "Third", "Fourth", "Fifth", "Sixth", "Seventh", "Eighth", "Ninth", "Tenth"]
-                            execution_order = [f"{ordinals[i]}: {process}" for i, process in enumerate(safe_sequence)]
-                            st.markdown("**Process Execution Order**:\n- " + "\n- ".join(execution_order))
-                            st.markdown(f"**Sequence**: {' -> '.join(safe_sequence)}")
+                            display_safe_sequence(safe_sequence)
                             st.markdown("""
                             This execution order indicates the sequence in which processes can safely complete without causing a deadlock.
                             """)
@@ -583,15 +736,15 @@ with tab3:
                             with col1:
                                 st.subheader("Updated Allocation")
                                 alloc_df = pd.DataFrame(allocation_matrix, index=processes, columns=resources)
-                                st.dataframe(alloc_df.style.highlight_max(axis=None, color='lightgreen'))
+                                display_matrix(alloc_df, color='lightgreen')
                             with col2:
                                 st.subheader("Updated Maximum")
                                 max_df = pd.DataFrame(max_matrix, index=processes, columns=resources)
-                                st.dataframe(max_df.style.highlight_max(axis=None, color='lightsalmon'))
+                                display_matrix(max_df, color='lightsalmon')
                             with col3:
                                 st.subheader("Updated Available")
                                 avail_df = pd.DataFrame(available_resources, index=resources, columns=["Available"])
-                                st.dataframe(avail_df)
+                                display_matrix(avail_df)
                             
                             st.session_state.pop('strategies', None)
                         else:
@@ -655,7 +808,16 @@ with tab4:
         'Status': ['Running' if random.random() > 0.2 else 'Waiting' for _ in range(len(processes))]
     }
     process_df = pd.DataFrame(process_data)
-    st.dataframe(process_df.style.highlight_max(subset=['CPU (%)', 'Memory (MB)'], color='yellow'))
+    
+    # Highlight column maxima over all processes, but only style the visible page
+    start, end = page_selector(len(process_df), MATRIX_PAGE_SIZE, "process_view")
+    column_max = process_df[['CPU (%)', 'Memory (MB)']].max()
+    st.dataframe(process_df.iloc[start:end].style.apply(
+        lambda column: np.where(column == column_max[column.name], 'background-color: yellow', ''),
+        subset=['CPU (%)', 'Memory (MB)']
+    ))
+    if len(process_df) > MATRIX_PAGE_SIZE:
+        st.caption(f"Showing rows {start + 1}-{end} of {len(process_df)}")
     
     if st.toggle("Enable Real-time Monitoring", value=False):
         st.info("Real-time monitoring enabled.")